@@ -3,18 +3,22 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
+import importlib
+from typing import Any, TYPE_CHECKING
+
 __version__ = "0.0.0"
 
-from clusterscope.lib import (
-    cluster,
-    cpus,
-    get_job,
-    get_tmp_dir,
-    job_gen_task_slurm,
-    local_node_gpu_generation_and_count,
-    mem,
-    slurm_version,
-)
+if TYPE_CHECKING:
+    from clusterscope.lib import (
+        cluster,
+        cpus,
+        get_job,
+        get_tmp_dir,
+        job_gen_task_slurm,
+        local_node_gpu_generation_and_count,
+        mem,
+        slurm_version,
+    )
 
 __all__ = [
     "cluster",
@@ -26,3 +30,20 @@ __all__ = [
     "job_gen_task_slurm",
     "get_tmp_dir",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from clusterscope import lib
+
+        return getattr(lib, name)
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
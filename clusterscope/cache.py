@@ -6,12 +6,20 @@
 import ast
 import fcntl
 import functools
+import hashlib
 import logging
 import os
+import stat
+import subprocess
+import tempfile
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, Hashable, Union
 
 CACHE_PATH = "/tmp/clusterscopewhoami"
+CMD_CACHE_DIR = os.path.join(tempfile.gettempdir(), f"clusterscope-{os.getuid()}")
+NOCACHE_ENV_VAR = "CLUSTERSCOPE_NOCACHE"
+CLUSTER_ENV_VARS = ("SLURM_CONF", "SLURM_CLUSTERS")
 
 
 def save(
@@ -70,12 +78,13 @@ def load(filepath: str = CACHE_PATH) -> Dict[Hashable, Union[str, float, bool, i
     try:
         fcntl.flock(f.fileno(), fcntl.LOCK_SH)
         for line in f:
-            if "=" in line:
-                key, val_str = line.strip().split("=", 1)
-                try:
-                    loaded[key] = ast.literal_eval(val_str)
-                except (ValueError, SyntaxError):
-                    loaded[key] = val_str
+            key, sep, val_str = line.strip().partition("=")
+            if not sep:
+                continue
+            try:
+                loaded[key] = ast.literal_eval(val_str)
+            except (ValueError, SyntaxError):
+                loaded[key] = val_str
     finally:
         fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         f.close()
@@ -85,17 +94,97 @@ def load(filepath: str = CACHE_PATH) -> Dict[Hashable, Union[str, float, bool, i
 
 def fs_cache(var_name: str, filepath: str = CACHE_PATH):
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        memo: Dict[str, Any] = {}
+
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if var_name in memo:
+                return memo[var_name]
+
             cache = load(filepath=filepath)
 
             if var_name in cache:
-                return cache[var_name]
+                memo[var_name] = cache[var_name]
+                return memo[var_name]
 
             result = fn(*args, **kwargs)
             save(filepath=filepath, values={var_name: result})
+            memo[var_name] = result
             return result
 
+        wrapper.cache_clear = memo.clear  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
+
+
+def _is_private_dir(path: str) -> bool:
+    """Create `path` if needed and check that only the current user can access it."""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def run_cached(cmd: list[str], ttl: float = 0, cache_dir: str = CMD_CACHE_DIR) -> str:
+    """Run a command and return its stdout, reusing a previous output for `ttl` seconds.
+
+    Outputs are stored per user, one file per command line and Slurm cluster
+    (SLURM_CONF, SLURM_CLUSTERS), so successive CLI invocations don't re-run the
+    same Slurm query. Caching is skipped when `ttl <= 0`, when
+    CLUSTERSCOPE_NOCACHE=1 is set, or when `cache_dir` is not a directory
+    private to the current user.
+
+    Raises:
+        subprocess.SubprocessError, FileNotFoundError: If the command fails.
+    """
+    use_cache = (
+        ttl > 0
+        and os.environ.get(NOCACHE_ENV_VAR) != "1"
+        and _is_private_dir(cache_dir)
+    )
+    if not use_cache:
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        ).stdout
+
+    cluster = [f"{var}={os.environ.get(var, '')}" for var in CLUSTER_ENV_VARS]
+    key = hashlib.sha256("\0".join(cmd + cluster).encode()).hexdigest()
+    path = os.path.join(cache_dir, key)
+    try:
+        if time.time() - os.stat(path).st_mtime < ttl:
+            with open(path) as f:
+                return f.read()
+    except OSError:
+        pass
+
+    stdout = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    ).stdout
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(stdout)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logging.debug(f"Failed to cache output of {cmd=}: {e}")
+    return stdout
@@ -4,22 +4,63 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
-import json
-from typing import Any, Dict, Optional
+import os
+import shutil
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
 
 import click
 from click_option_group import optgroup, RequiredMutuallyExclusiveOptionGroup
 
-from clusterscope.cluster_info import AWSClusterInfo, UnifiedInfo
-from clusterscope.validate import (
-    job_gen_task_slurm_validator,
-    validate_partition_exists,
+if TYPE_CHECKING:
+    from clusterscope.cluster_info import UnifiedInfo
+
+
+CACHE_TTL_SECONDS = 60
+
+FORMAT_METHODS = {
+    "json": "to_json",
+    "sbatch": "to_sbatch",
+    "slurm_directives": "to_sbatch",
+    "slurm_cli": "to_srun",
+    "submitit": "to_submitit",
+}
+
+
+partition_option = click.option(
+    "--partition",
+    type=str,
+    default=None,
+    help="Slurm partition name to filter queries (optional)",
+)
+json_option = click.option(
+    "--json", "as_json", is_flag=True, help="Output in JSON format"
 )
 
 
-def format_dict(data: Dict[str, Any]) -> str:
+@lru_cache(maxsize=None)
+def get_unified_info(partition: Optional[str] = None) -> "UnifiedInfo":
+    """Get a UnifiedInfo instance shared by all the queries of a CLI invocation."""
+    from clusterscope.cluster_info import UnifiedInfo
+
+    return UnifiedInfo(partition=partition, cache_ttl=CACHE_TTL_SECONDS)
+
+
+def format_dict(data: Union[Dict[str, Any], List[Any]]) -> str:
     """Format a dictionary for display."""
-    return json.dumps(data, indent=2)
+    from clusterscope.cluster_info import format_json
+
+    return format_json(data)
+
+
+def exec_sinfo(output_format: str, partition: Optional[str] = None) -> None:
+    """Replace the current process with `sinfo`, which prints its output unprocessed."""
+    if shutil.which("sinfo") is None:
+        raise click.ClickException("sinfo not found, --raw requires a Slurm cluster")
+    cmd = ["sinfo", "-o", output_format, "--noconvert", "--noheader"]
+    if partition is not None:
+        cmd.extend(["-p", partition])
+    os.execvp("sinfo", cmd)
 
 
 @click.group()
@@ -44,143 +85,154 @@ def version():
 
 
 @cli.command()
-@click.option(
-    "--partition",
-    type=str,
-    default=None,
-    help="Slurm partition name to filter queries (optional)",
-)
-def info(partition: str):
+@partition_option
+@json_option
+def info(partition: str, as_json: bool):
     """Show basic cluster information."""
     if partition is not None:
-        validate_partition_exists(partition=partition, exit_on_error=True)
-    unified_info = UnifiedInfo(partition=partition)
+        from clusterscope.validate import validate_partition_exists
+
+        validate_partition_exists(
+            partition=partition, exit_on_error=True, cache_ttl=CACHE_TTL_SECONDS
+        )
+    unified_info = get_unified_info(partition)
     cluster_name = unified_info.get_cluster_name()
     slurm_version = unified_info.get_slurm_version()
+    if as_json:
+        click.echo(
+            format_dict({"cluster_name": cluster_name, "slurm_version": slurm_version})
+        )
+        return
     click.echo(f"Cluster Name: {cluster_name}")
     click.echo(f"Slurm Version: {slurm_version}")
 
 
 @cli.command()
-@click.option(
-    "--partition",
-    type=str,
-    default=None,
-    help="Slurm partition name to filter queries (optional)",
-)
-def cpus(partition: str):
+@partition_option
+@json_option
+@click.option("--raw", is_flag=True, help="Print the unprocessed sinfo output")
+def cpus(partition: str, as_json: bool, raw: bool):
     """Show CPU counts per node."""
+    if raw and as_json:
+        raise click.UsageError("--raw cannot be combined with --json")
+    if raw:
+        exec_sinfo("%c,%P", partition)
     if partition is not None:
-        validate_partition_exists(partition=partition, exit_on_error=True)
-    unified_info = UnifiedInfo(partition=partition)
-    cpu_info = unified_info.get_cpus_per_node()
+        from clusterscope.validate import validate_partition_exists
+
+        validate_partition_exists(
+            partition=partition, exit_on_error=True, cache_ttl=CACHE_TTL_SECONDS
+        )
+    unified_info = get_unified_info(partition)
+    with unified_info.snapshot():
+        cpu_info = unified_info.get_cpus_per_node()
     cpu_info_list = cpu_info if isinstance(cpu_info, list) else [cpu_info]
-    click.echo("CPU Count, Slurm Partition:")
-    for cpu in cpu_info_list:
-        if partition is not None and partition != cpu.partition:
-            continue
-        click.echo(f"{cpu.cpu_count}, {cpu.partition}")
+    if partition is not None:
+        cpu_info_list = [cpu for cpu in cpu_info_list if cpu.partition == partition]
+    if as_json:
+        click.echo(format_dict([cpu._asdict() for cpu in cpu_info_list]))
+        return
+    lines = ["CPU Count, Slurm Partition:"]
+    lines.extend(f"{cpu.cpu_count}, {cpu.partition}" for cpu in cpu_info_list)
+    click.echo("\n".join(lines))
 
 
 @cli.command()
-@click.option(
-    "--partition",
-    type=str,
-    default=None,
-    help="Slurm partition name to filter queries (optional)",
-)
-def mem(partition: str):
+@partition_option
+@json_option
+@click.option("--raw", is_flag=True, help="Print the unprocessed sinfo output")
+def mem(partition: str, as_json: bool, raw: bool):
     """Show memory information per node."""
+    if raw and as_json:
+        raise click.UsageError("--raw cannot be combined with --json")
+    if raw:
+        exec_sinfo("%m,%P", partition)
     if partition is not None:
-        validate_partition_exists(partition=partition, exit_on_error=True)
-    unified_info = UnifiedInfo(partition=partition)
-    mem_info = unified_info.get_mem_per_node_MB()
+        from clusterscope.validate import validate_partition_exists
+
+        validate_partition_exists(
+            partition=partition, exit_on_error=True, cache_ttl=CACHE_TTL_SECONDS
+        )
+    unified_info = get_unified_info(partition)
+    with unified_info.snapshot():
+        mem_info = unified_info.get_mem_per_node_MB()
     mem_info_list = mem_info if isinstance(mem_info, list) else [mem_info]
-    click.echo("Mem total MB, Mem total GB, Slurm Partition:")
-    for mem in mem_info_list:
-        if partition is not None and partition != mem.partition:
-            continue
-        click.echo(f"{mem.mem_total_MB}, {mem.mem_total_GB}, {mem.partition}")
+    if partition is not None:
+        mem_info_list = [mem for mem in mem_info_list if mem.partition == partition]
+    if as_json:
+        click.echo(format_dict([mem._asdict() for mem in mem_info_list]))
+        return
+    lines = ["Mem total MB, Mem total GB, Slurm Partition:"]
+    lines.extend(
+        f"{mem.mem_total_MB}, {mem.mem_total_GB}, {mem.partition}"
+        for mem in mem_info_list
+    )
+    click.echo("\n".join(lines))
 
 
 @cli.command()
-@click.option(
-    "--partition",
-    type=str,
-    default=None,
-    help="Slurm partition name to filter queries (optional)",
-)
+@partition_option
 @click.option("--generations", is_flag=True, help="Show only GPU generations")
 @click.option("--counts", is_flag=True, help="Show only GPU counts by type")
 @click.option("--vendor", is_flag=True, help="Show GPU vendor information")
-def gpus(partition: str, generations: bool, counts: bool, vendor: bool):
+@json_option
+def gpus(partition: str, generations: bool, counts: bool, vendor: bool, as_json: bool):
     """Show GPU information."""
     if partition is not None:
-        validate_partition_exists(partition=partition, exit_on_error=True)
-    unified_info = UnifiedInfo(partition=partition)
+        from clusterscope.validate import validate_partition_exists
 
-    if vendor:
-        gpus = unified_info.get_gpu_generation_and_count()
-        all_vendors = set()
-        if gpus:
-            click.echo("GPU Vendors:")
-            for gpu in gpus:
-                if partition is not None and partition != gpu.partition:
-                    continue
-                if gpu.vendor in all_vendors:
-                    continue
-                all_vendors.add(gpu.vendor)
-                click.echo(f"{gpu.vendor}")
-    elif counts:
+        validate_partition_exists(
+            partition=partition, exit_on_error=True, cache_ttl=CACHE_TTL_SECONDS
+        )
+    unified_info = get_unified_info(partition)
+    with unified_info.snapshot():
         gpus = unified_info.get_gpu_generation_and_count()
-        if gpus:
-            click.echo("GPU Gen, GPU Count, Slurm Partition:")
-            for gpu in gpus:
-                if partition is not None and partition != gpu.partition:
-                    continue
-                click.echo(f"{gpu.gpu_gen}, {gpu.gpu_count}, {gpu.partition}")
-        else:
-            click.echo("No GPUs found")
+    if partition is not None:
+        gpus = [gpu for gpu in gpus if gpu.partition == partition]
+
+    if vendor:
+        vendors = list(dict.fromkeys(gpu.vendor for gpu in gpus))
+        if as_json:
+            click.echo(format_dict(vendors))
+        elif vendors:
+            click.echo("\n".join(["GPU Vendors:", *vendors]))
+        return
+
+    if counts:
+        header = "GPU Gen, GPU Count, Slurm Partition:"
+        fields: tuple[str, ...] = ("gpu_gen", "gpu_count", "partition")
     elif generations:
-        gpus = unified_info.get_gpu_generation_and_count()
-        if gpus:
-            click.echo("GPU Gen, Slurm Partition:")
-            for gpu in gpus:
-                if partition is not None and partition != gpu.partition:
-                    continue
-                click.echo(f"{gpu.gpu_gen}, {gpu.partition}")
-        else:
-            click.echo("No GPUs found")
+        header = "GPU Gen, Slurm Partition:"
+        fields = ("gpu_gen", "partition")
     else:
-        gpus = unified_info.get_gpu_generation_and_count()
-        if gpus:
-            click.echo("GPU Gen, GPU Count, GPU Vendor, Slurm Partition:")
-            for gpu in gpus:
-                if partition is not None and partition != gpu.partition:
-                    continue
-                click.echo(
-                    f"{gpu.gpu_gen}, {gpu.gpu_count}, {gpu.vendor}, {gpu.partition}"
-                )
-        else:
-            click.echo("No GPUs found")
+        header = "GPU Gen, GPU Count, GPU Vendor, Slurm Partition:"
+        fields = ("gpu_gen", "gpu_count", "vendor", "partition")
+    rows = [{field: getattr(gpu, field) for field in fields} for gpu in gpus]
+
+    if as_json:
+        click.echo(format_dict(rows))
+    elif rows:
+        lines = [header]
+        lines.extend(", ".join(str(value) for value in row.values()) for row in rows)
+        click.echo("\n".join(lines))
+    else:
+        click.echo("No GPUs found")
 
 
 @cli.command(name="check-gpu")
 @click.argument("gpu_type")
-@click.option(
-    "--partition",
-    type=str,
-    default=None,
-    help="Slurm partition name to filter queries (optional)",
-)
-def check_gpu(gpu_type: str, partition: str):
+@partition_option
+@json_option
+def check_gpu(gpu_type: str, partition: str, as_json: bool):
     """Check if a specific GPU type exists.
 
     GPU_TYPE: GPU type to check for (e.g., A100, MI300X)
     """
-    unified_info = UnifiedInfo(partition=partition)
+    unified_info = get_unified_info(partition)
     has_gpu = unified_info.has_gpu_type(gpu_type)
-    if has_gpu:
+    if as_json:
+        click.echo(format_dict({"gpu": gpu_type, "available": has_gpu}))
+    elif has_gpu:
         click.echo(f"GPU type {gpu_type} is available in the cluster.")
     else:
         click.echo(f"GPU type {gpu_type} is NOT available in the cluster.")
@@ -189,6 +241,8 @@ def check_gpu(gpu_type: str, partition: str):
 @cli.command()
 def aws():
     """Check if running on AWS and show NCCL settings."""
+    from clusterscope.cluster_info import AWSClusterInfo
+
     aws_cluster_info = AWSClusterInfo()
     is_aws = aws_cluster_info.is_aws_cluster()
     if is_aws:
@@ -229,7 +283,7 @@ def task():
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "sbatch", "slurm_directives", "slurm_cli", "submitit"]),
+    type=click.Choice(list(FORMAT_METHODS)),
     default="json",
     help="Format to output the job requirements in",
 )
@@ -259,15 +313,18 @@ def slurm(
     cpus_per_task: Optional[int],
 ):
     """Generate job requirements for a task of a Slurm job based on GPU or CPU per task requirements."""
+    from clusterscope.validate import job_gen_task_slurm_validator
+
     job_gen_task_slurm_validator(
         partition=partition,
         gpus_per_task=gpus_per_task,
         cpus_per_task=cpus_per_task,
         tasks_per_node=tasks_per_node,
         exit_on_error=True,
+        cache_ttl=CACHE_TTL_SECONDS,
     )
 
-    unified_info = UnifiedInfo(partition=partition)
+    unified_info = get_unified_info(partition)
     job_requirements = unified_info.get_task_resource_requirements(
         partition=partition,
         cpus_per_task=cpus_per_task,
@@ -275,16 +332,7 @@ def slurm(
         tasks_per_node=tasks_per_node,
         nodes=nodes,
     )
-
-    # Route to the correct format method based on CLI option
-    format_methods = {
-        "json": job_requirements.to_json,
-        "sbatch": job_requirements.to_sbatch,
-        "slurm_directives": job_requirements.to_sbatch,
-        "slurm_cli": job_requirements.to_srun,
-        "submitit": job_requirements.to_submitit,
-    }
-    click.echo(format_methods[output_format]())
+    click.echo(getattr(job_requirements, FORMAT_METHODS[output_format])())
 
 
 def main():
@@ -8,16 +8,34 @@ import logging
 import math
 import os
 import platform
+import re
 import shutil
 import subprocess
 from collections import defaultdict
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Dict, NamedTuple, Optional, Set
+from typing import Dict, Iterator, NamedTuple, Optional, Set
 
-from clusterscope.cache import fs_cache
+from clusterscope.cache import fs_cache, run_cached
 from clusterscope.parser import parse_memory_to_gb
 from clusterscope.shell import run_cli
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+GRES_GPU_RE = re.compile(r"gpu:([^:(,]+):(\d+)")
+
+
+def format_json(data: dict | list) -> str:
+    """Serialize data as indented JSON, using orjson when it's installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 class ResourceShape(NamedTuple):
     """Represents resource requirements for a job in Slurm SBATCH format."""
@@ -42,7 +60,7 @@ class ResourceShape(NamedTuple):
         Returns:
             str: JSON representation of the resource requirements
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return format_json(self.to_dict())
 
     def to_sbatch(self) -> str:
         """Convert ResourceShape to SBATCH script format.
@@ -101,7 +119,7 @@ class ResourceShape(NamedTuple):
             value = getattr(self, attr_name)
             if value is not None:
                 params[attr_name] = value
-        return json.dumps(params, indent=2)
+        return format_json(params)
 
 
 class GPUInfo(NamedTuple):
@@ -157,16 +175,20 @@ AMD_GPU_TYPES = {
 
 
 class UnifiedInfo:
-    def __init__(self, partition: Optional[str] = None):
+    def __init__(self, partition: Optional[str] = None, cache_ttl: float = 0):
         """Initialize the UnifiedInfo instance.
 
         Args:
             partition (str, optional): Slurm partition name to filter queries.
                                      If None, queries all partitions.
+            cache_ttl (float): Seconds to reuse Slurm query outputs across processes.
+                               0 disables caching.
         """
         self.partition = partition
         self.local_node_info = LocalNodeInfo()
-        self.slurm_cluster_info = SlurmClusterInfo(partition=partition)
+        self.slurm_cluster_info = SlurmClusterInfo(
+            partition=partition, cache_ttl=cache_ttl
+        )
         self.is_slurm_cluster = self.slurm_cluster_info.verify_slurm_available()
         self.has_nvidia_gpus = self.local_node_info.has_nvidia_gpus()
         self.has_amd_gpus = self.local_node_info.has_amd_gpus()
@@ -208,6 +230,19 @@ class UnifiedInfo:
             return self.slurm_cluster_info.get_slurm_version()
         return "0"
 
+    @contextmanager
+    def snapshot(self) -> Iterator[None]:
+        """Fetch CPUs, memory and GPUs of the Slurm nodes with a single query.
+
+        get_cpus_per_node, get_mem_per_node_MB and get_gpu_generation_and_count
+        calls inside the `with` block reuse it. No-op if not a Slurm cluster.
+        """
+        if not self.is_slurm_cluster:
+            yield
+            return
+        with self.slurm_cluster_info.snapshot():
+            yield
+
     def get_cpus_per_node(self) -> list[CPUInfo] | CPUInfo:
         """Get the number of CPUs for each node in the cluster. Returns 0 if not a Slurm cluster.
 
@@ -305,11 +340,14 @@ class UnifiedInfo:
             raise ValueError("tasks_per_node must be at least 1")
 
         self.partition = partition
-        cpus_per_node = self.get_cpus_per_node()
+        with self.snapshot():
+            cpus_per_node = self.get_cpus_per_node()
+            mem_per_node = self.get_mem_per_node_MB()
+            if gpus_per_task is not None:
+                total_gpus_per_node = self.get_total_gpus_per_node()
         total_cpus_per_node = (
             cpus_per_node[0] if isinstance(cpus_per_node, list) else cpus_per_node
         )
-        mem_per_node = self.get_mem_per_node_MB()
         total_ram_per_node = (
             mem_per_node[0] if isinstance(mem_per_node, list) else mem_per_node
         )
@@ -324,8 +362,6 @@ class UnifiedInfo:
             )
         # GPU Request
         elif gpus_per_task is not None:
-            total_gpus_per_node = self.get_total_gpus_per_node()
-
             cpu_cores_per_gpu = total_cpus_per_node.cpu_count / total_gpus_per_node
             total_required_cpu_cores_per_task = math.floor(
                 cpu_cores_per_gpu * gpus_per_task
@@ -423,7 +459,7 @@ class LinuxInfo:
         """
         try:
             result = run_cli(["free", "-m"], text=True, timeout=timeout)
-            for line in result.strip().split("\n"):
+            for line in result.splitlines():
                 if "Mem:" in line:
                     parts = line.split()
                     mem_total_MB = int(parts[1])
@@ -527,7 +563,7 @@ class LocalNodeInfo:
             )
 
             gpu_info: Dict[str, int] = defaultdict(int)
-            lines = result.strip().split("\n")
+            lines = result.splitlines()
             all_lines = set()
             for line in lines:
                 if line in all_lines:
@@ -589,7 +625,7 @@ class LocalNodeInfo:
             )
 
             gpu_info: Dict[str, int] = defaultdict(int)
-            for line in result.strip().split("\n"):
+            for line in result.splitlines():
                 if "GPU" in line and ":" in line:
                     # Parse lines like "GPU[0]: AMD Instinct MI300X"
                     parts = line.split(":")
@@ -692,14 +728,18 @@ class SlurmClusterInfo:
     such as cluster name, available resources, and node configurations.
     """
 
-    def __init__(self, partition: Optional[str] = None):
+    def __init__(self, partition: Optional[str] = None, cache_ttl: float = 0):
         """Initialize the Cluster instance.
 
         Args:
             partition (str, optional): Slurm partition name to filter queries.
                                      If None, queries all partitions.
+            cache_ttl (float): Seconds to reuse sinfo outputs across processes.
+                               0 disables caching.
         """
         self.partition = partition
+        self.cache_ttl = cache_ttl
+        self._snapshot: Optional[Dict[str, list[tuple[str, ...]]]] = None
         self.is_slurm_cluster = False
         if shutil.which("sinfo") is not None:
             self.is_slurm_cluster = self.verify_slurm_available()
@@ -761,14 +801,51 @@ class SlurmClusterInfo:
                 check=True,
             )
 
-            for line in result.stdout.split("\n"):
+            for line in result.stdout.splitlines():
                 if "ClusterName" in line:
-                    return line.split("=")[1].strip()
+                    return line.partition("=")[2].strip()
 
             raise RuntimeError("Could not find cluster name in scontrol output")
         except (subprocess.SubprocessError, FileNotFoundError) as e:
             raise RuntimeError(f"Failed to get cluster name: {str(e)}")
 
+    @contextmanager
+    def snapshot(self) -> Iterator[None]:
+        """Query CPUs, memory and GRES of the nodes with a single `sinfo` call.
+
+        Inside the `with` block, get_cpus_per_node, get_mem_per_node_MB and
+        get_gpu_generation_and_count are answered from the snapshot instead of
+        running `sinfo` each. The snapshot is dropped when the block exits.
+
+        Raises:
+            RuntimeError: If unable to retrieve node information.
+        """
+        try:
+            cmd = ["sinfo", "-o", "%100c|%100m|%G|%100P", "--noconvert", "--noheader"]
+            if self.partition:
+                cmd.extend(["-p", self.partition])
+
+            result = run_cached(cmd, ttl=self.cache_ttl)
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            logging.error(f"Failed to get Slurm node information: {str(e)}")
+            raise RuntimeError(f"Failed to get Slurm node information: {str(e)}")
+
+        snapshot: Dict[str, Dict[tuple[str, ...], None]] = {
+            "cpus": {},
+            "mem": {},
+            "gres": {},
+        }
+        for line in result.splitlines():
+            cpus, mem, gres, partition = line.split("|")
+            snapshot["cpus"][(cpus, partition)] = None
+            snapshot["mem"][(mem, partition)] = None
+            snapshot["gres"][(gres, partition)] = None
+        self._snapshot = {key: list(rows) for key, rows in snapshot.items()}
+        try:
+            yield
+        finally:
+            self._snapshot = None
+
     def get_mem_per_node_MB(self) -> list[MemInfo]:
         """Get the lowest memory available per node in the cluster.
 
@@ -779,22 +856,19 @@ class SlurmClusterInfo:
             RuntimeError: If unable to retrieve node information.
         """
         try:
-            cmd = ["sinfo", "-o", "%100m,%100P", "--noconvert", "--noheader"]
-            if self.partition:
-                cmd.extend(["-p", self.partition])
+            if self._snapshot is not None:
+                rows = self._snapshot["mem"]
+            else:
+                cmd = ["sinfo", "-o", "%100m,%100P", "--noconvert", "--noheader"]
+                if self.partition:
+                    cmd.extend(["-p", self.partition])
 
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+                result = run_cached(cmd, ttl=self.cache_ttl)
+                rows = [tuple(line.split(",")) for line in result.splitlines()]
 
             logging.debug("Parsing node information...")
             results = []
-            for line in result.stdout.splitlines():
-                mem, partition = line.split(",")
+            for mem, partition in rows:
                 mem_MB = int(mem.strip("+ "))
                 results.append(
                     MemInfo(
@@ -804,7 +878,7 @@ class SlurmClusterInfo:
                     )
                 )
             return results
-            raise RuntimeError(f"No mem information found in: {result.stdout}")
+            raise RuntimeError(f"No mem information found in: {rows}")
         except (subprocess.SubprocessError, FileNotFoundError) as e:
             logging.error(f"Failed to get Slurm memory information: {str(e)}")
             raise RuntimeError(f"Failed to get Slurm memory information: {str(e)}")
@@ -819,28 +893,25 @@ class SlurmClusterInfo:
             RuntimeError: If unable to retrieve node information or if nodes have different CPU counts.
         """
         try:
-            cmd = ["sinfo", "-o", "%100c,%100P", "--noheader"]
-            if self.partition:
-                cmd.extend(["-p", self.partition])
+            if self._snapshot is not None:
+                rows = self._snapshot["cpus"]
+            else:
+                cmd = ["sinfo", "-o", "%100c,%100P", "--noheader"]
+                if self.partition:
+                    cmd.extend(["-p", self.partition])
 
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+                result = run_cached(cmd, ttl=self.cache_ttl)
+                rows = [tuple(line.split(",")) for line in result.splitlines()]
 
             logging.debug("Parsing node information...")
             all_cpus = []
-            for line in result.stdout.splitlines():
-                cpus, partition = line.split(",")
+            for cpus, partition in rows:
                 cpu_count = int(cpus.strip("+ "))
                 all_cpus.append(
                     CPUInfo(cpu_count=cpu_count, partition=partition.strip("* "))
                 )
             if all_cpus == []:
-                raise RuntimeError(f"No CPU information found in: {result.stdout}")
+                raise RuntimeError(f"No CPU information found in: {rows}")
             return all_cpus
         except (subprocess.SubprocessError, FileNotFoundError) as e:
             logging.error(f"Failed to get CPU information: {str(e)}")
@@ -854,36 +925,33 @@ class SlurmClusterInfo:
             dict: A dictionary with GPU generation as keys and counts as values.
         """
         try:
-            # Run sinfo command
-            cmd = ["sinfo", "-o", "%G,%P"]
-            if self.partition:
-                cmd.extend(["-p", self.partition])
+            if self._snapshot is not None:
+                rows = self._snapshot["gres"]
+            else:
+                # Run sinfo command
+                cmd = ["sinfo", "-o", "%G,%P"]
+                if self.partition:
+                    cmd.extend(["-p", self.partition])
 
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+                result = run_cached(cmd, ttl=self.cache_ttl)
+                rows = [tuple(line.split(",")) for line in result.splitlines()]
 
             results = []
             all_lines = set()
 
             # Parse output
             logging.debug("Parsing node information...")
-            for line in result.stdout.splitlines():
-                gres, partition = line.split(",")
+            for gres, partition in rows:
                 gres_gpu_gen_and_count = gres.split("(")[0]
                 uniq_gpus = gres_gpu_gen_and_count + partition
                 if uniq_gpus in all_lines:
                     continue
                 all_lines.add(uniq_gpus)
                 partition = partition.strip("* ")
-                gres_parts = gres.split(":")
-                if len(gres_parts) >= 3:
-                    gpu_gen = gres_parts[1]
-                    gpu_count = int(gres_parts[2].split("(")[0])
+                match = GRES_GPU_RE.search(gres)
+                if match:
+                    gpu_gen = match.group(1)
+                    gpu_count = int(match.group(2))
                     vendor = "Vendor Not Found"
                     if gpu_gen.upper() in NVIDIA_GPU_TYPES:
                         vendor = "nvidia"
@@ -918,21 +986,12 @@ class SlurmClusterInfo:
             if self.partition:
                 cmd.extend(["-p", self.partition])
 
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+            result = run_cached(cmd, ttl=self.cache_ttl)
 
             gpu_generations = set()
 
-            for line in result.stdout.split("\n"):
-                if line.strip():
-                    parts = line.split(":")
-                    if len(parts) >= 2 and not parts[2].isdigit():
-                        gpu_generations.add(parts[2].upper())
+            for match in GRES_GPU_RE.finditer(result):
+                gpu_generations.add(match.group(1).upper())
 
             if not gpu_generations:
                 return set()  # Return empty set if no GPUs found
@@ -975,9 +1034,9 @@ class SlurmClusterInfo:
                 check=True,
             )
 
-            for line in result.stdout.split("\n"):
+            for line in result.stdout.splitlines():
                 if "MaxJobTime" in line:
-                    return line.split("=")[1].strip()
+                    return line.partition("=")[2].strip()
 
             raise RuntimeError("Could not find MaxJobTime in scontrol output")
         except (subprocess.SubprocessError, FileNotFoundError) as e:
@@ -991,16 +1050,17 @@ class AWSClusterInfo:
         Returns:
             bool: True if running on AWS, False otherwise
         """
+        # Check for AWS-specific system files
         try:
-            # Check for AWS-specific system files
-            result = subprocess.run(
-                ["cat", "/sys/devices/virtual/dmi/id/sys_vendor"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            return "amazon" in result.stdout.lower()
-        except (subprocess.SubprocessError, FileNotFoundError):
+            with open("/sys/devices/virtual/dmi/id/sys_vendor") as f:
+                if "amazon" in f.read().lower():
+                    return True
+        except OSError:
+            pass
+        try:
+            with open("/sys/hypervisor/uuid") as f:
+                return f.read().lower().startswith("ec2")
+        except OSError:
             return False
 
     def get_aws_nccl_settings(self) -> Dict[str, str]:
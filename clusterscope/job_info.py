@@ -3,14 +3,64 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
+from __future__ import annotations
+
 import os
 import random
+import re
+import socket
 import subprocess
-
 from functools import lru_cache
+from typing import Optional
+
+__all__ = ["JobInfo", "MIN_MASTER_PORT", "MAX_MASTER_PORT"]
 
 MIN_MASTER_PORT, MAX_MASTER_PORT = (20_000, 60_000)
 
+JOB_ENV_VARS = (
+    "LOCAL_RANK",
+    "RANK",
+    "WORLD_SIZE",
+    "MASTER_ADDR",
+    "MASTER_PORT",
+    "TORCHELASTIC_RUN_ID",
+    "SLURM_JOB_ID",
+    "SLURM_JOB_NAME",
+    "SLURM_PROCID",
+    "SLURM_LOCALID",
+    "SLURM_NTASKS",
+    "SLURM_NTASKS_PER_NODE",
+    "SLURM_JOB_NODELIST",
+    "SLURM_NNODES",
+    "SLURM_JOB_NUM_NODES",
+    "SLURMD_NODENAME",
+)
+
+SLURM_TO_TORCH_ENV = (
+    ("WORLD_SIZE", "SLURM_NTASKS"),
+    ("RANK", "SLURM_PROCID"),
+    ("LOCAL_RANK", "SLURM_LOCALID"),
+    ("CUDA_VISIBLE_DEVICES", "SLURM_LOCALID"),
+)
+
+SIMPLE_NODELIST_RE = re.compile(r"^([^,\[]+)(?:,|$)")
+
+
+@lru_cache(maxsize=8)
+def _first_hostname(nodelist: str) -> str:
+    """Get the first hostname of a Slurm nodelist, e.g. `node[001-003]` -> `node001`."""
+    result = subprocess.run(
+        ["scontrol", "show", "hostnames", nodelist],
+        capture_output=True,
+    )
+    if result.returncode == 0:
+        end = result.stdout.find(b"\n")
+        return (result.stdout if end == -1 else result.stdout[:end]).decode()
+
+    raise RuntimeError(
+        f"`scontrol show hostnames` failed: {result.returncode=}, {result.stdout=}, {result.stderr=}"
+    )
+
 
 class JobInfo:
     """
@@ -23,122 +73,95 @@ class JobInfo:
     Global Rank: RANK, SLURM_PROCID
     Local Rank: LOCAL_RANK, SLURM_LOCALID
     World Size: WORLD_SIZE, SLURM_NTASKS
-    Master Address: MASTER_ADDR, SLURM_JOB_NODELIST[0] (first hostname in the job)
+    Master Address: MASTER_ADDR, SLURM_JOB_NODELIST[0] (first hostname in the job),
+                    SLURMD_NODENAME or the hostname for single node jobs
     Master Port: MASTER_PORT, rand(MIN_MASTER_PORT, MAX_MASTER_PORT)
 
     To set all torch distributed env vars from slurm env vars, see `set_torch_distributed_env_from_slurm`
+
+    The env variables above are read once, when the JobInfo is created.
     """
 
     def __init__(self):
-        self.is_torch_run = lambda: "LOCAL_RANK" in os.environ
-        self.is_torchelastic_run = lambda: "TORCHELASTIC_RUN_ID" in os.environ
-        self.is_slurm_job = lambda: "SLURM_JOB_ID" in os.environ
-        self.is_slurm_srun = lambda: "SLURM_PROCID" in os.environ
+        self._env = {k: os.environ[k] for k in JOB_ENV_VARS if k in os.environ}
+        self.is_torch_run = "LOCAL_RANK" in self._env
+        self.is_torchelastic_run = "TORCHELASTIC_RUN_ID" in self._env
+        self.is_slurm_job = "SLURM_JOB_ID" in self._env
+        self.is_slurm_srun = "SLURM_PROCID" in self._env
+
+        self.job_id = self._env_int("SLURM_JOB_ID", default=0)
+        self.job_name = (
+            self._env.get("SLURM_JOB_NAME", "") if self.is_slurm_job else "local"
+        )
+        self.global_rank = self._env_int("RANK", "SLURM_PROCID", default=0)
+        self.local_rank = self._env_int("LOCAL_RANK", "SLURM_LOCALID", default=0)
+        self.world_size = self._env_int("WORLD_SIZE", "SLURM_NTASKS", default=1)
+        self.is_rank_zero = self.global_rank == 0
+        rng = random.Random(self.job_id if self.is_slurm_job else -1)
+        self.master_port = self._env_int(
+            "MASTER_PORT", default=rng.randint(MIN_MASTER_PORT, MAX_MASTER_PORT)
+        )
+        self._master_addr: Optional[str] = self._env.get("MASTER_ADDR")
+
+    def _env_int(self, *keys: str, default: int) -> int:
+        """Parse the first of `keys` that is set in the env as an int, or return `default`."""
+        for key in keys:
+            value = self._env.get(key)
+            if value is not None:
+                try:
+                    return int(value)
+                except ValueError:
+                    raise RuntimeError(f"{key} cannot be parsed. {value=}")
+        return default
 
-    @lru_cache(maxsize=1)
     def get_job_id(self) -> int:
-        if self.is_slurm_job():
-            job_id = os.environ.get("SLURM_JOB_ID")
-            # is_slurm_job() checks if SLURM_JOB_ID variable exists in the env.
-            # this assert should always pass, unless something undefines the variable.
-            assert job_id is not None, "SLURM_JOB_ID is not set"
-            try:
-                parsed_job_id = int(job_id)
-            except ValueError:
-                raise RuntimeError(f"Slurm job ID cannot be parsed. {job_id=}")
-            return parsed_job_id
-        return 0
-
-    @lru_cache(maxsize=1)
+        return self.job_id
+
     def get_job_name(self) -> str:
-        if self.is_slurm_job():
-            return os.environ.get("SLURM_JOB_NAME", "")
-        return "local"
+        return self.job_name
 
-    @lru_cache(maxsize=1)
     def get_global_rank(self) -> int:
-        maybe_global_rank = os.environ.get("RANK")
-        if maybe_global_rank is not None:
-            try:
-                global_rank = int(maybe_global_rank)
-            except ValueError:
-                raise RuntimeError(f"RANK cannot be parsed. {global_rank=}")
-            return global_rank
-        if self.is_slurm_srun():
-            return int(os.environ["SLURM_PROCID"])
-        return 0
-
-    @lru_cache(maxsize=1)
+        return self.global_rank
+
     def get_local_rank(self) -> int:
-        maybe_local_rank = os.environ.get("LOCAL_RANK")
-        if maybe_local_rank is not None:
-            try:
-                local_rank = int(maybe_local_rank)
-            except ValueError:
-                raise RuntimeError(f"LOCAL_RANK cannot be parsed. {local_rank=}")
-            return local_rank
-        if self.is_slurm_srun():
-            return int(os.environ["SLURM_LOCALID"])
-        return 0
-
-    @lru_cache(maxsize=1)
+        return self.local_rank
+
     def get_world_size(self) -> int:
-        maybe_world_size = os.environ.get("WORLD_SIZE")
-        if maybe_world_size is not None:
-            try:
-                world_size = int(maybe_world_size)
-            except ValueError:
-                raise RuntimeError(f"WORLD_SIZE cannot be parsed. {world_size=}")
-            return world_size
-        if self.is_slurm_job():
-            return int(os.environ["SLURM_NTASKS"])
-        return 1
-
-    @lru_cache(maxsize=1)
+        return self.world_size
+
     def get_is_rank_zero(self) -> bool:
-        return self.get_global_rank() == 0
+        return self.is_rank_zero
 
-    @lru_cache(maxsize=1)
     def get_master_port(self) -> int:
-        maybe_master_port = os.environ.get("MASTER_PORT")
-        if maybe_master_port is not None:
-            try:
-                master_port = int(maybe_master_port)
-            except ValueError:
-                raise RuntimeError(f"master port cannot be parsed. {master_port=}")
-            return master_port
-        rng = random.Random(int(os.environ.get("SLURM_JOB_ID", -1)))
-        return rng.randint(MIN_MASTER_PORT, MAX_MASTER_PORT)
-
-    @lru_cache(maxsize=1)
-    def get_master_addr(self) -> str:
-        maybe_master_addr = os.environ.get("MASTER_ADDR")
-        if maybe_master_addr is not None:
-            return maybe_master_addr
-        if self.is_slurm_job():
-            result = subprocess.run(
-                ["scontrol", "show", "hostnames", os.environ["SLURM_JOB_NODELIST"]],
-                capture_output=True,
-                text=True,
-            )
+        return self.master_port
 
-            if result.returncode == 0:
-                if node_list := result.stdout.split("\n"):
-                    return node_list[0]
-
-            raise RuntimeError(
-                f"`scontrol show hostnames` failed: {result.returncode=}, {result.stdout=}, {result.stderr=}"
+    def get_master_addr(self) -> str:
+        if self._master_addr is not None:
+            return self._master_addr
+        if self.is_slurm_job:
+            nnodes = self._env.get("SLURM_NNODES") or self._env.get(
+                "SLURM_JOB_NUM_NODES"
             )
+            if nnodes == "1":
+                nodename = self._env.get("SLURMD_NODENAME")
+                self._master_addr = nodename or socket.gethostname()
+            else:
+                nodelist = self._env["SLURM_JOB_NODELIST"]
+                if match := SIMPLE_NODELIST_RE.match(nodelist):
+                    self._master_addr = match.group(1)
+                else:
+                    self._master_addr = _first_hostname(nodelist)
+            return self._master_addr
         return "127.0.0.1"
 
     def set_torch_distributed_env_from_slurm(self) -> None:
-        if self.is_slurm_srun():
-            os.environ["WORLD_SIZE"] = str(os.environ.get("SLURM_NTASKS"))
-            os.environ["RANK"] = str(os.environ.get("SLURM_PROCID"))
-            os.environ["LOCAL_WORLD_SIZE"] = os.environ.get(
-                "SLURM_NTASKS_PER_NODE", "1"
-            )
-            os.environ["LOCAL_RANK"] = str(os.environ.get("SLURM_LOCALID"))
-            os.environ["MASTER_ADDR"] = self.get_master_addr()
-            os.environ["MASTER_PORT"] = str(self.get_master_port())
-            os.environ["CUDA_VISIBLE_DEVICES"] = str(os.environ.get("SLURM_LOCALID"))
+        if self.is_slurm_srun:
+            updates = {
+                dst: self._env[src]
+                for dst, src in SLURM_TO_TORCH_ENV
+                if src in self._env
+            }
+            updates["LOCAL_WORLD_SIZE"] = self._env.get("SLURM_NTASKS_PER_NODE", "1")
+            updates["MASTER_ADDR"] = self.get_master_addr()
+            updates["MASTER_PORT"] = str(self.get_master_port())
+            os.environ.update(updates)
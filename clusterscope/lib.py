@@ -3,6 +3,9 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
+from __future__ import annotations
+
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from clusterscope.cluster_info import (
@@ -18,6 +21,18 @@ from clusterscope.validate import (
     validate_partition_exists,
 )
 
+__all__ = [
+    "cluster",
+    "slurm_version",
+    "cpus",
+    "mem",
+    "local_node_gpu_generation_and_count",
+    "get_job",
+    "get_unified_info",
+    "job_gen_task_slurm",
+    "get_tmp_dir",
+]
+
 # Partition-aware unified info instance
 _unified_info: Optional[UnifiedInfo] = None
 _current_partition: Optional[str] = None
@@ -106,9 +121,17 @@ def get_tmp_dir():
     return tmp
 
 
+@lru_cache(maxsize=1)
+def _local_node_gpus() -> Tuple[GPUInfo, ...]:
+    return tuple(local_info.get_gpu_generation_and_count())
+
+
 def local_node_gpu_generation_and_count() -> list[GPUInfo]:
-    """Get the GPU generation and count for the local node."""
-    return local_info.get_gpu_generation_and_count()
+    """Get the GPU generation and count for the local node.
+
+    The GPUs are only queried once per process.
+    """
+    return list(_local_node_gpus())
 
 
 def job_gen_task_slurm(
@@ -5,16 +5,21 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
-def parse_memory_to_gb(memory) -> int:
+def parse_memory_to_gb(memory: str | int) -> int:
     """Parse memory string and convert to GB.
 
+    Args:
+        memory (str | int): Memory such as "225G" or "1T", or a value already in GB.
+
     Returns:
         int: Memory in GB
     """
-    mem_value = memory.rstrip("GT")
-    if memory.endswith("T"):
-        return int(mem_value) * 1024
-    elif memory.endswith("G"):
-        return int(mem_value)
+    if isinstance(memory, int):
+        return memory
+    unit = memory[-1:]
+    if unit == "T":
+        return int(memory[:-1]) * 1024
+    elif unit == "G":
+        return int(memory[:-1])
     else:
         raise RuntimeError(f"Invalid memory format: {memory}")
@@ -6,6 +6,8 @@
 # LICENSE file in the root directory of this source tree.
 import re
 
+GRES_GPU_COUNT_RE = re.compile(r"gpu(?::\w+)?:(\d+)")
+
 
 def parse_gres(gres_str: str) -> int:
     """Parse GPU count from GRES string.
@@ -20,7 +22,7 @@ def parse_gres(gres_str: str) -> int:
     if not gres_str or gres_str == "(null)":
         return 0
 
-    match = re.search(r"gpu(?::\w+)?:(\d+)", gres_str)
+    match = GRES_GPU_COUNT_RE.search(gres_str)
     if match:
         return int(match.group(1))
 
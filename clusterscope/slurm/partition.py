@@ -4,13 +4,28 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
+import logging
+import os
+import re
+import subprocess
+import time
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from clusterscope.shell import run_cli
+from clusterscope.cache import NOCACHE_ENV_VAR, run_cached
 from clusterscope.slurm.parser import parse_gres
 
+SCONTROL_KV_RE = re.compile(r"([^\s=]+)=(\S*)")
 
-@dataclass
+PARTITION_TTL_ENV_VAR = "CLUSTERSCOPE_PARTITION_TTL"
+DEFAULT_PARTITION_TTL_SECONDS = 60
+
+_partition_info_fetched_at = float("-inf")
+
+
+@dataclass(slots=True, frozen=True)
 class PartitionInfo:
     """Store partition information from scontrol."""
 
@@ -19,60 +34,126 @@ class PartitionInfo:
     max_cpus_per_node: int
 
 
-def get_partition_resources(partition: str) -> dict:
-    result = run_cli(
-        [
-            "sinfo",
-            "-o",
-            "%G,%c",
-            f"--partition={partition}",
-            "--noheader",
-        ],
+def get_partition_resources(partition: str, cache_ttl: float = 0) -> dict:
+    return get_all_partition_resources(partition=partition, cache_ttl=cache_ttl).get(
+        partition, {"max_gpus": 0, "max_cpus": 0}
     )
 
-    max_gpus = 0
-    max_cpus = 0
 
-    for line in result.strip().split("\n"):
+def get_all_partition_resources(
+    partition: Optional[str] = None, cache_ttl: float = 0
+) -> dict[str, dict]:
+    """Query max GPUs and CPUs per node for every partition with a single sinfo call.
+
+    Args:
+        partition: Only query this partition (optional)
+        cache_ttl: Seconds to reuse the sinfo output across processes (default: 0)
+    """
+    cmd = ["sinfo", "-o", "%R|%G|%c", "--noheader"]
+    if partition is not None:
+        cmd.append(f"--partition={partition}")
+    result = _run_partition_query(cmd, cache_ttl)
+
+    resources: dict[str, dict] = {}
+    for line in result.splitlines():
         if not line:
             continue
-        gres, cpus = line.split(",")
-        gpus = parse_gres(gres)
-
-        max_gpus = max(max_gpus, gpus)
-        max_cpus = max(max_cpus, int(cpus))
+        partition, gres, cpus = line.split("|")
+        partition_resources = resources.setdefault(
+            partition.strip(), {"max_gpus": 0, "max_cpus": 0}
+        )
+        partition_resources["max_gpus"] = max(
+            partition_resources["max_gpus"], parse_gres(gres)
+        )
+        partition_resources["max_cpus"] = max(
+            partition_resources["max_cpus"], int(cpus)
+        )
 
-    return {
-        "max_gpus": max_gpus,
-        "max_cpus": max_cpus,
-    }
+    return resources
 
 
-def get_partition_info() -> list[PartitionInfo]:
+def get_partition_info(cache_ttl: float = 0) -> list[PartitionInfo]:
     """
     Query Slurm for partition information using scontrol.
     Returns a list of PartitionInfo objects.
+
+    Results are reused within the process for CLUSTERSCOPE_PARTITION_TTL
+    seconds (default 60). Caching is skipped when CLUSTERSCOPE_NOCACHE=1 is set.
+
+    Args:
+        cache_ttl: Seconds to reuse the scontrol and sinfo outputs across
+            processes (default: 0)
+    """
+    _expire_partition_info()
+    return list(_get_partition_info_cached(cache_ttl))
+
+
+def get_partition_map(cache_ttl: float = 0) -> Mapping[str, PartitionInfo]:
+    """Return a read-only mapping of partition name to PartitionInfo.
+
+    Shares the cache of get_partition_info.
     """
-    result = run_cli(["scontrol", "show", "partition", "-o"])
+    _expire_partition_info()
+    return _get_partition_map_cached(cache_ttl)
+
+
+def _partition_ttl() -> float:
+    ttl = os.environ.get(PARTITION_TTL_ENV_VAR)
+    if ttl is None:
+        return DEFAULT_PARTITION_TTL_SECONDS
+    try:
+        return float(ttl)
+    except ValueError:
+        logging.warning(
+            f"Invalid {PARTITION_TTL_ENV_VAR}={ttl!r}, using {DEFAULT_PARTITION_TTL_SECONDS} seconds"
+        )
+        return DEFAULT_PARTITION_TTL_SECONDS
+
+
+def _run_partition_query(cmd: list[str], cache_ttl: float) -> str:
+    try:
+        return run_cached(cmd, ttl=cache_ttl)
+    except (subprocess.SubprocessError, FileNotFoundError) as e:
+        raise RuntimeError(f"Failed to execute command '{' '.join(cmd)}': {str(e)}")
+
 
-    max_gpus = 0
+def _expire_partition_info() -> None:
+    global _partition_info_fetched_at
+
+    ttl = _partition_ttl()
+    now = time.monotonic()
+    if (
+        os.environ.get(NOCACHE_ENV_VAR) == "1"
+        or now - _partition_info_fetched_at >= ttl
+    ):
+        _get_partition_info_cached.cache_clear()
+        _get_partition_map_cached.cache_clear()
+        _partition_info_fetched_at = now
+
+
+@lru_cache(maxsize=1)
+def _get_partition_map_cached(cache_ttl: float) -> Mapping[str, PartitionInfo]:
+    return MappingProxyType({p.name: p for p in _get_partition_info_cached(cache_ttl)})
+
+
+@lru_cache(maxsize=1)
+def _get_partition_info_cached(cache_ttl: float) -> tuple[PartitionInfo, ...]:
+    result = _run_partition_query(["scontrol", "show", "partition", "-o"], cache_ttl)
+    resources = get_all_partition_resources(cache_ttl=cache_ttl)
 
     partitions = []
-    for line in result.strip().split("\n"):
+    for line in result.splitlines():
         if not line:
             continue
 
-        partition_data = {}
-        for item in line.split():
-            if "=" in item:
-                key, value = item.split("=", 1)
-                partition_data[key] = value
-
+        partition_data = dict(SCONTROL_KV_RE.findall(line))
         partition_name = partition_data.get("PartitionName", "Unknown")
 
         nodes = partition_data.get("Nodes", "")
         if nodes and nodes != "(null)":
-            partition_info = get_partition_resources(partition=partition_name)
+            partition_info = resources.get(
+                partition_name, {"max_gpus": 0, "max_cpus": 0}
+            )
         else:
             partition_info = {
                 "max_gpus": 0,
@@ -86,4 +167,4 @@ def get_partition_info() -> list[PartitionInfo]:
         )
         partitions.append(partition)
 
-    return partitions
+    return tuple(partitions)
@@ -9,23 +9,23 @@ import logging
 import sys
 from typing import Optional
 
-from clusterscope.slurm.partition import get_partition_info, PartitionInfo
+from clusterscope.slurm.partition import get_partition_map, PartitionInfo
 
 
 def validate_partition_exists(
-    partition: str, exit_on_error: bool = False
+    partition: str, exit_on_error: bool = False, cache_ttl: float = 0
 ) -> PartitionInfo:
-    partitions = get_partition_info()
-    req_partition = next((p for p in partitions if p.name == partition), None)
+    partitions = get_partition_map(cache_ttl=cache_ttl)
+    req_partition = partitions.get(partition)
 
     if req_partition is None:
         if exit_on_error:
             logging.error(
-                f"Partition {partition} not found. Available partitions: {[p.name for p in partitions]}"
+                f"Partition {partition} not found. Available partitions: {list(partitions)}"
             )
             sys.exit(1)
         raise ValueError(
-            f"Partition {partition} not found. Available partitions: {[p.name for p in partitions]}"
+            f"Partition {partition} not found. Available partitions: {list(partitions)}"
         )
     return req_partition
 
@@ -36,6 +36,7 @@ def job_gen_task_slurm_validator(
     gpus_per_task: Optional[int] = None,
     cpus_per_task: Optional[int] = None,
     exit_on_error: bool = False,
+    cache_ttl: float = 0,
 ) -> None:
     """Validate the job requirements for a task of a Slurm job based on GPU or CPU per task requirements.
     This validation is used for CLI and API calls.
@@ -77,6 +78,7 @@ def job_gen_task_slurm_validator(
     req_partition = validate_partition_exists(
         partition=partition,
         exit_on_error=exit_on_error,
+        cache_ttl=cache_ttl,
     )
 
     # reject if requires more GPUs than the max GPUs per node for the partition
@@ -0,0 +1,137 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from clusterscope.cache import fs_cache, NOCACHE_ENV_VAR, run_cached
+
+
+class TestFsCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.filepath = os.path.join(self.tmp_dir.name, "whoami")
+
+    def test_fs_cache_memoizes_in_process(self):
+        fn = MagicMock(return_value="24.11.4")
+        cached_fn = fs_cache(var_name="SLURM_VERSION", filepath=self.filepath)(fn)
+        with (
+            patch("clusterscope.cache.load", return_value={}) as mock_load,
+            patch("clusterscope.cache.save") as mock_save,
+        ):
+            self.assertEqual(cached_fn(), "24.11.4")
+            self.assertEqual(cached_fn(), "24.11.4")
+        fn.assert_called_once()
+        mock_load.assert_called_once_with(filepath=self.filepath)
+        mock_save.assert_called_once()
+
+    def test_fs_cache_persists_across_processes(self):
+        fn = MagicMock(return_value="24.11.4")
+        fs_cache(var_name="SLURM_VERSION", filepath=self.filepath)(fn)()
+        other_fn = MagicMock(return_value="25.05.0")
+        cached_fn = fs_cache(var_name="SLURM_VERSION", filepath=self.filepath)(other_fn)
+        self.assertEqual(cached_fn(), "24.11.4")
+        other_fn.assert_not_called()
+
+
+class TestRunCached(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    @patch("subprocess.run")
+    def test_run_cached_no_ttl(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        for _ in range(2):
+            result = run_cached(["sinfo", "-o", "%c,%P"], cache_dir=self.tmp_dir.name)
+            self.assertEqual(result, "128,cpu\n")
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @patch("subprocess.run")
+    def test_run_cached_reuses_output(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        for _ in range(2):
+            result = run_cached(
+                ["sinfo", "-o", "%c,%P"], ttl=60, cache_dir=self.tmp_dir.name
+            )
+            self.assertEqual(result, "128,cpu\n")
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_run_cached_keyed_by_command(self, mock_run):
+        mock_run.side_effect = [
+            MagicMock(stdout="128,cpu\n", returncode=0),
+            MagicMock(stdout="64,gpu\n", returncode=0),
+        ]
+        self.assertEqual(
+            run_cached(["sinfo", "-p", "cpu"], ttl=60, cache_dir=self.tmp_dir.name),
+            "128,cpu\n",
+        )
+        self.assertEqual(
+            run_cached(["sinfo", "-p", "gpu"], ttl=60, cache_dir=self.tmp_dir.name),
+            "64,gpu\n",
+        )
+
+    @patch("subprocess.run")
+    def test_run_cached_expired(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        (cached,) = os.listdir(self.tmp_dir.name)
+        os.utime(os.path.join(self.tmp_dir.name, cached), (0, 0))
+        run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("subprocess.run")
+    def test_run_cached_disabled_by_env(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        with patch.dict(os.environ, {NOCACHE_ENV_VAR: "1"}):
+            run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+            run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("subprocess.run")
+    def test_run_cached_keyed_by_cluster(self, mock_run):
+        mock_run.side_effect = [
+            MagicMock(stdout="128,cpu\n", returncode=0),
+            MagicMock(stdout="64,gpu\n", returncode=0),
+        ]
+        with patch.dict(os.environ, {"SLURM_CLUSTERS": "cluster_a"}):
+            result = run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+            self.assertEqual(result, "128,cpu\n")
+        with patch.dict(os.environ, {"SLURM_CLUSTERS": "cluster_b"}):
+            result = run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+            self.assertEqual(result, "64,gpu\n")
+
+    @patch("subprocess.run")
+    def test_run_cached_skips_shared_dir(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        os.chmod(self.tmp_dir.name, 0o777)
+        run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @patch("subprocess.run")
+    def test_run_cached_skips_other_users_dir(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        with patch("os.getuid", return_value=os.getuid() + 1):
+            run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @patch("os.replace", side_effect=OSError("replace failed"))
+    @patch("subprocess.run")
+    def test_run_cached_removes_temp_file(self, mock_run, mock_replace):
+        mock_run.return_value = MagicMock(stdout="128,cpu\n", returncode=0)
+        result = run_cached(["sinfo"], ttl=60, cache_dir=self.tmp_dir.name)
+        self.assertEqual(result, "128,cpu\n")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from clusterscope import cli as cli_module
+from clusterscope.cli import cli
+from clusterscope.cluster_info import CPUInfo, GPUInfo, MemInfo, UnifiedInfo
+
+
+class TestCli(unittest.TestCase):
+    """Test cases for the cscope commands."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = CliRunner()
+
+    def setUp(self):
+        self.unified_info = MagicMock(spec_set=UnifiedInfo)
+        self.unified_info.get_cpus_per_node.return_value = [
+            CPUInfo(cpu_count=192, partition="h100"),
+            CPUInfo(cpu_count=96, partition="cpu"),
+        ]
+        self.unified_info.get_mem_per_node_MB.return_value = [
+            MemInfo(mem_total_MB=1000000, mem_total_GB=976, partition="h100"),
+        ]
+        self.unified_info.get_gpu_generation_and_count.return_value = [
+            GPUInfo(gpu_gen="h100", gpu_count=8, vendor="nvidia", partition="h100"),
+            GPUInfo(gpu_gen="mi300x", gpu_count=8, vendor="amd", partition="amd"),
+        ]
+        patcher = patch.object(
+            cli_module, "get_unified_info", return_value=self.unified_info
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cpus(self):
+        result = self.runner.invoke(cli, ["cpus"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            result.output, "CPU Count, Slurm Partition:\n192, h100\n96, cpu\n"
+        )
+
+    def test_cpus_json(self):
+        result = self.runner.invoke(cli, ["cpus", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            json.loads(result.output),
+            [
+                {"cpu_count": 192, "partition": "h100"},
+                {"cpu_count": 96, "partition": "cpu"},
+            ],
+        )
+
+    @patch("shutil.which", return_value="/usr/bin/sinfo")
+    @patch("os.execvp", side_effect=SystemExit(0))
+    def test_cpus_raw(self, mock_execvp, mock_which):
+        result = self.runner.invoke(cli, ["cpus", "--raw", "--partition", "h100"])
+        self.assertEqual(result.exit_code, 0)
+        mock_execvp.assert_called_once_with(
+            "sinfo",
+            [
+                "sinfo",
+                "-o",
+                "%c,%P",
+                "--noconvert",
+                "--noheader",
+                "-p",
+                "h100",
+            ],
+        )
+
+    @patch("os.execvp")
+    def test_cpus_raw_with_json(self, mock_execvp):
+        result = self.runner.invoke(cli, ["cpus", "--raw", "--json"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("--raw cannot be combined with --json", result.output)
+        mock_execvp.assert_not_called()
+
+    @patch("shutil.which", return_value=None)
+    @patch("os.execvp")
+    def test_mem_raw_without_slurm(self, mock_execvp, mock_which):
+        result = self.runner.invoke(cli, ["mem", "--raw"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("sinfo not found", result.output)
+        mock_execvp.assert_not_called()
+
+    def test_mem_json(self):
+        result = self.runner.invoke(cli, ["mem", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            json.loads(result.output),
+            [{"mem_total_MB": 1000000, "mem_total_GB": 976, "partition": "h100"}],
+        )
+
+    def test_gpus(self):
+        result = self.runner.invoke(cli, ["gpus"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            result.output,
+            "GPU Gen, GPU Count, GPU Vendor, Slurm Partition:\n"
+            "h100, 8, nvidia, h100\n"
+            "mi300x, 8, amd, amd\n",
+        )
+
+    def test_gpus_counts_json(self):
+        result = self.runner.invoke(cli, ["gpus", "--counts", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            json.loads(result.output),
+            [
+                {"gpu_gen": "h100", "gpu_count": 8, "partition": "h100"},
+                {"gpu_gen": "mi300x", "gpu_count": 8, "partition": "amd"},
+            ],
+        )
+
+    def test_gpus_vendor_json(self):
+        result = self.runner.invoke(cli, ["gpus", "--vendor", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(json.loads(result.output), ["nvidia", "amd"])
+
+    def test_gpus_none_found(self):
+        self.unified_info.get_gpu_generation_and_count.return_value = []
+        result = self.runner.invoke(cli, ["gpus"])
+        self.assertEqual(result.output, "No GPUs found\n")
+        result = self.runner.invoke(cli, ["gpus", "--json"])
+        self.assertEqual(json.loads(result.output), [])
+
+    def test_info_json(self):
+        self.unified_info.get_cluster_name.return_value = "test_cluster"
+        self.unified_info.get_slurm_version.return_value = "24.11.4"
+        result = self.runner.invoke(cli, ["info", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            json.loads(result.output),
+            {"cluster_name": "test_cluster", "slurm_version": "24.11.4"},
+        )
+
+    def test_check_gpu_json(self):
+        self.unified_info.has_gpu_type.return_value = True
+        result = self.runner.invoke(cli, ["check-gpu", "A100", "--json"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(json.loads(result.output), {"gpu": "A100", "available": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,8 @@
 # LICENSE file in the root directory of this source tree.
 import subprocess
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import mock_open, patch
 
 from clusterscope.cluster_info import (
     AWSClusterInfo,
@@ -22,6 +23,10 @@ from clusterscope.cluster_info import (
 )
 
 
+def _result(stdout: str = "", returncode: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(stdout=stdout, returncode=returncode)
+
+
 class TestUnifiedInfo(unittest.TestCase):
 
     def test_get_cluster_name(self):
@@ -84,39 +89,47 @@ class TestDarwinInfo(unittest.TestCase):
 
 
 class TestSlurmClusterInfo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch("subprocess.run")
+        cls.mock_run = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        cls.cluster_info = SlurmClusterInfo()
+        cls.cluster_info_with_partition = SlurmClusterInfo(partition="test_partition")
+
     def setUp(self):
-        self.cluster_info = SlurmClusterInfo()
-        self.cluster_info_with_partition = SlurmClusterInfo(partition="test_partition")
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+        SlurmClusterInfo.get_cluster_name.cache_clear()
+        SlurmClusterInfo.get_slurm_version.cache_clear()
+        self.cluster_info._snapshot = None
+        self.cluster_info_with_partition._snapshot = None
 
-    @patch("subprocess.run")
     @patch("clusterscope.cache.load")
-    def test_get_cluster_name(self, mock_cache, mock_run):
+    def test_get_cluster_name(self, mock_cache):
         # Mock successful cluster name retrieval
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="ClusterName=test_cluster\nOther=value", returncode=0
         )
         mock_cache.return_value = {"SLURM_CLUSTER_NAME": "test_cluster"}
         self.assertEqual(self.cluster_info.get_cluster_name(), "test_cluster")
 
-    @patch("subprocess.run")
-    def test_get_cpu_per_node(self, mock_run):
+    def test_get_cpu_per_node(self):
         # Mock successful cluster name retrieval
-        mock_run.return_value = MagicMock(stdout="128, test_partition", returncode=0)
+        self.mock_run.return_value = _result(stdout="128, test_partition", returncode=0)
         self.assertEqual(
             self.cluster_info.get_cpus_per_node(),
             [CPUInfo(cpu_count=128, partition="test_partition")],
         )
 
-    @patch("subprocess.run")
     @patch("clusterscope.cache.load", return_value={})  # Mock empty cache
     @patch("clusterscope.cache.save")  # Mock cache save function
-    def test_get_cpu_per_node_with_partition(self, mock_save, mock_load, mock_run):
+    def test_get_cpu_per_node_with_partition(self, mock_save, mock_load):
         # Mock successful CPU per node retrieval with partition
-        mock_run.return_value = MagicMock(stdout="128, test_partition", returncode=0)
+        self.mock_run.return_value = _result(stdout="128, test_partition", returncode=0)
         result = self.cluster_info_with_partition.get_cpus_per_node()
         self.assertEqual(result, [CPUInfo(cpu_count=128, partition="test_partition")])
         # Verify that partition argument was passed to subprocess.run
-        mock_run.assert_called_with(
+        self.mock_run.assert_called_with(
             ["sinfo", "-o", "%100c,%100P", "--noheader", "-p", "test_partition"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -124,28 +137,26 @@ class TestSlurmClusterInfo(unittest.TestCase):
             check=True,
         )
 
-    @patch("subprocess.run")
-    def test_get_mem_per_node_MB(self, mock_run):
+    def test_get_mem_per_node_MB(self):
         # Mock successful cluster name retrieval
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="123456+, test_partition", returncode=0
         )
         self.assertEqual(
             self.cluster_info.get_mem_per_node_MB()[0].mem_total_MB, 123456
         )
 
-    @patch("subprocess.run")
     @patch("clusterscope.cache.load", return_value={})  # Mock empty cache
     @patch("clusterscope.cache.save")  # Mock cache save function
-    def test_get_mem_per_node_MB_with_partition(self, mock_save, mock_load, mock_run):
+    def test_get_mem_per_node_MB_with_partition(self, mock_save, mock_load):
         # Mock successful memory per node retrieval with partition
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="123456+, test_partition", returncode=0
         )
         result = self.cluster_info_with_partition.get_mem_per_node_MB()
         self.assertEqual(result[0].mem_total_MB, 123456)
         # Verify that partition argument was passed to subprocess.run
-        mock_run.assert_called_with(
+        self.mock_run.assert_called_with(
             [
                 "sinfo",
                 "-o",
@@ -161,67 +172,129 @@ class TestSlurmClusterInfo(unittest.TestCase):
             check=True,
         )
 
-    @patch("subprocess.run")
-    def test_get_max_job_lifetime(self, mock_run):
+    def test_snapshot(self):
+        self.mock_run.return_value = _result(
+            stdout="192|1000000|gpu:h100:8(S:0-1)|test_partition\n"
+            "192|1000000|gpu:h100:8(S:0-1)|test_partition\n",
+            returncode=0,
+        )
+        with self.cluster_info_with_partition.snapshot():
+            self.assertEqual(
+                self.cluster_info_with_partition.get_cpus_per_node(),
+                [CPUInfo(cpu_count=192, partition="test_partition")],
+            )
+            self.assertEqual(
+                self.cluster_info_with_partition.get_mem_per_node_MB(),
+                [
+                    MemInfo(
+                        mem_total_MB=1000000,
+                        mem_total_GB=976,
+                        partition="test_partition",
+                    )
+                ],
+            )
+            self.assertEqual(
+                self.cluster_info_with_partition.get_gpu_generation_and_count(),
+                [
+                    GPUInfo(
+                        gpu_gen="h100",
+                        gpu_count=8,
+                        vendor="nvidia",
+                        partition="test_partition",
+                    )
+                ],
+            )
+        self.mock_run.assert_called_once_with(
+            [
+                "sinfo",
+                "-o",
+                "%100c|%100m|%G|%100P",
+                "--noconvert",
+                "--noheader",
+                "-p",
+                "test_partition",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+
+    def test_snapshot_dropped_after_block(self):
+        self.mock_run.return_value = _result(
+            stdout="8|1000000|(null)|test_partition\n", returncode=0
+        )
+        with self.cluster_info_with_partition.snapshot():
+            pass
+        self.mock_run.return_value = _result(stdout="16,test_partition\n", returncode=0)
+        self.assertEqual(
+            self.cluster_info_with_partition.get_cpus_per_node(),
+            [CPUInfo(cpu_count=16, partition="test_partition")],
+        )
+        self.assertEqual(self.mock_run.call_count, 2)
+
+    def test_snapshot_error(self):
+        self.mock_run.side_effect = subprocess.SubprocessError()
+        with self.assertRaises(RuntimeError):
+            with self.cluster_info.snapshot():
+                pass
+
+    def test_get_max_job_lifetime(self):
         # Mock successful max job lifetime retrieval
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="MaxJobTime=1-00:00:00\nOther=value", returncode=0
         )
         self.assertEqual(self.cluster_info.get_max_job_lifetime(), "1-00:00:00")
 
-    @patch("subprocess.run")
-    def test_get_max_job_lifetime_error(self, mock_run):
+    def test_get_max_job_lifetime_error(self):
         # Mock failed command
-        mock_run.side_effect = subprocess.SubprocessError()
+        self.mock_run.side_effect = subprocess.SubprocessError()
         with self.assertRaises(RuntimeError):
             self.cluster_info.get_max_job_lifetime()
-        mock_run.side_effect = FileNotFoundError()
+        self.mock_run.side_effect = FileNotFoundError()
         with self.assertRaises(RuntimeError):
             self.cluster_info.get_max_job_lifetime()
 
-    @patch("subprocess.run")
-    def test_get_max_job_lifetime_not_found(self, mock_run):
+    def test_get_max_job_lifetime_not_found(self):
         # Mock successful command but MaxJobTime not in output
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="SomeOtherSetting=value\nAnotherSetting=value", returncode=0
         )
         with self.assertRaises(RuntimeError):
             self.cluster_info.get_max_job_lifetime()
 
-    @patch("subprocess.run")
-    def test_get_gpu_generations(self, mock_run):
+    def test_get_gpu_generations(self):
         # Mock successful GPU generations retrieval using 'sinfo -o %G'
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="GRES\ngres:gpu:a100:4\ngres:gpu:v100:2\ngres:gpu:p100:8\nother:resource:1",
             returncode=0,
         )
 
-        # Create an instance of the class
-        cluster_info = SlurmClusterInfo()
-
         # Call the method and check the result
-        result = cluster_info.get_gpu_generations()
+        result = self.cluster_info.get_gpu_generations()
         expected = {"A100", "V100", "P100"}
         self.assertEqual(result, expected)
 
-    @patch("subprocess.run")
-    def test_get_gpu_generations_no_gpus(self, mock_run):
+    def test_get_gpu_generations_no_gpus(self):
         # Mock output with no GPU information
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="GRES\nother:resource:1\n", returncode=0
         )
 
-        # Create an instance of the class
-        cluster_info = SlurmClusterInfo()
-
         # Call the method and check the result
-        result = cluster_info.get_gpu_generations()
+        result = self.cluster_info.get_gpu_generations()
         self.assertEqual(result, set())  # Should return an empty set
 
-    @patch("subprocess.run")
-    def test_get_gpu_generations_with_partition(self, mock_run):
+    def test_get_gpu_generations_gres_index(self):
+        self.mock_run.return_value = _result(
+            stdout="GRES\ngpu:a100:4(S:0-1)\ngpu:4\n(null)\n",
+            returncode=0,
+        )
+        self.assertEqual(self.cluster_info.get_gpu_generations(), {"A100"})
+
+    def test_get_gpu_generations_with_partition(self):
         # Mock successful GPU generations retrieval with partition
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="GRES\ngres:gpu:a100:4\ngres:gpu:v100:2\n",
             returncode=0,
         )
@@ -231,7 +304,7 @@ class TestSlurmClusterInfo(unittest.TestCase):
         self.assertEqual(result, expected)
 
         # Verify that partition argument was passed to subprocess.run
-        mock_run.assert_called_with(
+        self.mock_run.assert_called_with(
             ["sinfo", "-o", "%G", "-p", "test_partition"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -239,10 +312,9 @@ class TestSlurmClusterInfo(unittest.TestCase):
             check=True,
         )
 
-    @patch("subprocess.run")
-    def test_get_gpu_generation_and_count_duplicated_partitions(self, mock_run):
+    def test_get_gpu_generation_and_count_duplicated_partitions(self):
         # Mock successful GPU generation and count retrieval with partition
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="gpu:a100:4(S:0-1), test_partition\ngpu:a100:4, test_partition\ngpu:v100:2(S:0), test_partition\n",
             returncode=0,
         )
@@ -264,10 +336,9 @@ class TestSlurmClusterInfo(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
-    @patch("subprocess.run")
-    def test_get_gpu_generation_and_count_with_partition(self, mock_run):
+    def test_get_gpu_generation_and_count_with_partition(self):
         # Mock successful GPU generation and count retrieval with partition
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = _result(
             stdout="gpu:a100:4(S:0-1), test_partition\ngpu:v100:2(S:0), test_partition\n",
             returncode=0,
         )
@@ -290,7 +361,7 @@ class TestSlurmClusterInfo(unittest.TestCase):
         self.assertEqual(result, expected)
 
         # Verify that partition argument was passed to subprocess.run
-        mock_run.assert_called_with(
+        self.mock_run.assert_called_with(
             ["sinfo", "-o", "%G,%P", "-p", "test_partition"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -298,20 +369,16 @@ class TestSlurmClusterInfo(unittest.TestCase):
             check=True,
         )
 
-    @patch("subprocess.run")
-    def test_get_gpu_generations_error(self, mock_run):
-        # Create an instance of the class
-        cluster_info = SlurmClusterInfo()
-
+    def test_get_gpu_generations_error(self):
         # Mock failed command
-        mock_run.side_effect = subprocess.SubprocessError()
+        self.mock_run.side_effect = subprocess.SubprocessError()
         # Check that RuntimeError is raised
         with self.assertRaises(RuntimeError):
-            cluster_info.get_gpu_generations()
-        mock_run.side_effect = FileNotFoundError()
+            self.cluster_info.get_gpu_generations()
+        self.mock_run.side_effect = FileNotFoundError()
         # Check that RuntimeError is raised
         with self.assertRaises(RuntimeError):
-            cluster_info.get_gpu_generations()
+            self.cluster_info.get_gpu_generations()
 
     @patch("clusterscope.cluster_info.SlurmClusterInfo.get_gpu_generation_and_count")
     def test_has_gpu_type_true(self, mock_get_gpu_generation_and_count):
@@ -329,16 +396,13 @@ class TestSlurmClusterInfo(unittest.TestCase):
             ),
         ]
 
-        # Create an instance of the class containing the has_gpu_type method
-        gpu_manager = SlurmClusterInfo()
-
-        result = gpu_manager.has_gpu_type("A100")
+        result = self.cluster_info.has_gpu_type("A100")
         self.assertTrue(result)
 
-        result = gpu_manager.has_gpu_type("H100")
+        result = self.cluster_info.has_gpu_type("H100")
         self.assertFalse(result)
 
-        result = gpu_manager.has_gpu_type("V100")
+        result = self.cluster_info.has_gpu_type("V100")
         self.assertTrue(result)
 
 
@@ -465,7 +529,7 @@ class TestLocalNodeInfo(unittest.TestCase):
     @patch("subprocess.run")
     def test_has_nvidia_gpus_true(self, mock_run):
         """Test has_nvidia_gpus returns True when nvidia-smi is available."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _result(returncode=0)
         self.assertTrue(self.local_node_info.has_nvidia_gpus())
 
     @patch("subprocess.run")
@@ -483,7 +547,7 @@ class TestLocalNodeInfo(unittest.TestCase):
     @patch("subprocess.run")
     def test_has_amd_gpus_true(self, mock_run):
         """Test has_amd_gpus returns True when rocm-smi is available."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _result(returncode=0)
         self.assertTrue(self.local_node_info.has_amd_gpus())
 
     @patch("subprocess.run")
@@ -737,15 +801,26 @@ class TestAWSClusterInfo(unittest.TestCase):
     def setUp(self):
         self.aws_cluster_info = AWSClusterInfo()
 
-    @patch("subprocess.run")
-    def test_is_aws_cluster(self, mock_run):
+    def test_is_aws_cluster(self):
         # Mock AWS environment
-        mock_run.return_value = MagicMock(stdout="amazon_ec2", returncode=0)
-        self.assertTrue(self.aws_cluster_info.is_aws_cluster())
+        with patch("builtins.open", mock_open(read_data="Amazon EC2\n")):
+            self.assertTrue(self.aws_cluster_info.is_aws_cluster())
 
         # Mock non-AWS environment
-        mock_run.return_value = MagicMock(stdout="other_system", returncode=0)
-        self.assertFalse(self.aws_cluster_info.is_aws_cluster())
+        with patch("builtins.open", mock_open(read_data="other_system\n")):
+            self.assertFalse(self.aws_cluster_info.is_aws_cluster())
+
+    def test_is_aws_cluster_hypervisor_uuid(self):
+        def fake_open(path):
+            if path == "/sys/hypervisor/uuid":
+                return mock_open(read_data="ec2e1916-9099-7caf-fd21-012345abcdef")()
+            raise FileNotFoundError(path)
+
+        with patch("builtins.open", side_effect=fake_open):
+            self.assertTrue(self.aws_cluster_info.is_aws_cluster())
+
+        with patch("builtins.open", side_effect=FileNotFoundError):
+            self.assertFalse(self.aws_cluster_info.is_aws_cluster())
 
     def test_get_aws_nccl_settings(self):
         # Test with AWS cluster
@@ -0,0 +1,166 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from clusterscope.job_info import (
+    _first_hostname,
+    JobInfo,
+    MAX_MASTER_PORT,
+    MIN_MASTER_PORT,
+)
+
+SLURM_ENV = {
+    "SLURM_JOB_ID": "1234",
+    "SLURM_JOB_NAME": "test_job",
+    "SLURM_PROCID": "3",
+    "SLURM_LOCALID": "1",
+    "SLURM_NTASKS": "8",
+    "SLURM_NTASKS_PER_NODE": "4",
+    "SLURM_JOB_NODELIST": "node001",
+}
+
+
+class TestJobInfo(unittest.TestCase):
+    """Test cases for JobInfo."""
+
+    def test_local(self):
+        with patch.dict(os.environ, {}, clear=True):
+            job_info = JobInfo()
+        self.assertFalse(job_info.is_slurm_job)
+        self.assertFalse(job_info.is_slurm_srun)
+        self.assertEqual(job_info.get_job_id(), 0)
+        self.assertEqual(job_info.get_job_name(), "local")
+        self.assertEqual(job_info.get_global_rank(), 0)
+        self.assertEqual(job_info.get_local_rank(), 0)
+        self.assertEqual(job_info.get_world_size(), 1)
+        self.assertTrue(job_info.get_is_rank_zero())
+        self.assertEqual(job_info.get_master_addr(), "127.0.0.1")
+
+    def test_slurm(self):
+        with patch.dict(os.environ, SLURM_ENV, clear=True):
+            job_info = JobInfo()
+        self.assertTrue(job_info.is_slurm_job)
+        self.assertTrue(job_info.is_slurm_srun)
+        self.assertFalse(job_info.is_torch_run)
+        self.assertEqual(job_info.get_job_id(), 1234)
+        self.assertEqual(job_info.get_job_name(), "test_job")
+        self.assertEqual(job_info.get_global_rank(), 3)
+        self.assertEqual(job_info.get_local_rank(), 1)
+        self.assertEqual(job_info.get_world_size(), 8)
+        self.assertFalse(job_info.get_is_rank_zero())
+
+    def test_slurm_without_ntasks(self):
+        env = {"SLURM_JOB_ID": "1234", "SLURM_JOB_NODELIST": "node001"}
+        with patch.dict(os.environ, env, clear=True):
+            job_info = JobInfo()
+        self.assertEqual(job_info.get_world_size(), 1)
+        self.assertEqual(job_info.get_global_rank(), 0)
+
+    def test_torch_env_preferred(self):
+        env = {**SLURM_ENV, "RANK": "0", "LOCAL_RANK": "0", "WORLD_SIZE": "16"}
+        with patch.dict(os.environ, env, clear=True):
+            job_info = JobInfo()
+        self.assertEqual(job_info.get_global_rank(), 0)
+        self.assertEqual(job_info.get_local_rank(), 0)
+        self.assertEqual(job_info.get_world_size(), 16)
+
+    def test_invalid_env(self):
+        for key in ["SLURM_JOB_ID", "RANK", "LOCAL_RANK", "WORLD_SIZE", "MASTER_PORT"]:
+            with self.subTest(key=key):
+                with patch.dict(os.environ, {**SLURM_ENV, key: "abc"}, clear=True):
+                    with self.assertRaisesRegex(RuntimeError, key):
+                        JobInfo()
+
+    def test_master_port(self):
+        with patch.dict(os.environ, SLURM_ENV, clear=True):
+            master_port = JobInfo().get_master_port()
+            self.assertEqual(JobInfo().get_master_port(), master_port)
+        self.assertGreaterEqual(master_port, MIN_MASTER_PORT)
+        self.assertLessEqual(master_port, MAX_MASTER_PORT)
+
+    def test_env_read_at_init(self):
+        with patch.dict(os.environ, SLURM_ENV, clear=True):
+            job_info = JobInfo()
+            os.environ["RANK"] = "7"
+            self.assertEqual(job_info.get_global_rank(), 3)
+
+    @patch("subprocess.run")
+    def test_master_addr_simple_nodelist(self, mock_run):
+        for nodelist in ["node001", "node001,node002", "node001,gpu[001-004]"]:
+            with patch.dict(
+                os.environ, {**SLURM_ENV, "SLURM_JOB_NODELIST": nodelist}, clear=True
+            ):
+                self.assertEqual(JobInfo().get_master_addr(), "node001")
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_master_addr_compressed_nodelist(self, mock_run):
+        _first_hostname.cache_clear()
+        mock_run.return_value = MagicMock(
+            stdout=b"node001\nnode002\nnode003\n", returncode=0
+        )
+        env = {**SLURM_ENV, "SLURM_JOB_NODELIST": "node[001-003]"}
+        with patch.dict(os.environ, env, clear=True):
+            self.assertEqual(JobInfo().get_master_addr(), "node001")
+            self.assertEqual(JobInfo().get_master_addr(), "node001")
+        mock_run.assert_called_once_with(
+            ["scontrol", "show", "hostnames", "node[001-003]"],
+            capture_output=True,
+        )
+
+    @patch("socket.gethostname", return_value="gpu001.cluster")
+    @patch("subprocess.run")
+    def test_master_addr_single_node(self, mock_run, mock_gethostname):
+        env = {**SLURM_ENV, "SLURM_JOB_NODELIST": "gpu[001]", "SLURM_NNODES": "1"}
+        with patch.dict(os.environ, {**env, "SLURMD_NODENAME": "gpu001"}, clear=True):
+            self.assertEqual(JobInfo().get_master_addr(), "gpu001")
+        with patch.dict(os.environ, env, clear=True):
+            self.assertEqual(JobInfo().get_master_addr(), "gpu001.cluster")
+        del env["SLURM_JOB_NODELIST"]
+        with patch.dict(os.environ, env, clear=True):
+            self.assertEqual(JobInfo().get_master_addr(), "gpu001.cluster")
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_master_addr_scontrol_error(self, mock_run):
+        _first_hostname.cache_clear()
+        mock_run.return_value = MagicMock(stdout=b"", stderr=b"error", returncode=1)
+        env = {**SLURM_ENV, "SLURM_JOB_NODELIST": "node[001-003]"}
+        with patch.dict(os.environ, env, clear=True):
+            with self.assertRaises(RuntimeError):
+                JobInfo().get_master_addr()
+
+    def test_set_torch_distributed_env_from_slurm(self):
+        env = {**SLURM_ENV, "MASTER_ADDR": "node001", "MASTER_PORT": "29500"}
+        with patch.dict(os.environ, env, clear=True):
+            JobInfo().set_torch_distributed_env_from_slurm()
+            self.assertEqual(os.environ["WORLD_SIZE"], "8")
+            self.assertEqual(os.environ["RANK"], "3")
+            self.assertEqual(os.environ["LOCAL_WORLD_SIZE"], "4")
+            self.assertEqual(os.environ["LOCAL_RANK"], "1")
+            self.assertEqual(os.environ["MASTER_ADDR"], "node001")
+            self.assertEqual(os.environ["MASTER_PORT"], "29500")
+            self.assertEqual(os.environ["CUDA_VISIBLE_DEVICES"], "1")
+
+    def test_set_torch_distributed_env_from_slurm_missing_vars(self):
+        env = {
+            "SLURM_JOB_ID": "1234",
+            "SLURM_PROCID": "0",
+            "SLURM_LOCALID": "0",
+            "MASTER_ADDR": "node001",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            JobInfo().set_torch_distributed_env_from_slurm()
+            self.assertEqual(os.environ["RANK"], "0")
+            self.assertEqual(os.environ["LOCAL_RANK"], "0")
+            self.assertEqual(os.environ["LOCAL_WORLD_SIZE"], "1")
+            self.assertNotIn("WORLD_SIZE", os.environ)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import unittest
+from unittest.mock import MagicMock, patch
+
+import clusterscope
+from clusterscope import lib
+from clusterscope.cluster_info import GPUInfo, LocalNodeInfo
+
+
+class TestLib(unittest.TestCase):
+    def setUp(self):
+        lib._local_node_gpus.cache_clear()
+        self.addCleanup(lib._local_node_gpus.cache_clear)
+        patcher = patch.multiple(lib, _unified_info=None, _current_partition=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_package_lazy_attributes(self):
+        self.assertEqual(dir(clusterscope), sorted(clusterscope.__all__))
+        self.assertIs(clusterscope.cpus, lib.cpus)
+        self.assertIs(clusterscope.__getattr__("lib"), lib)
+        with self.assertRaises(AttributeError):
+            clusterscope.__getattr__("missing")
+
+    @patch("clusterscope.lib.UnifiedInfo")
+    def test_get_unified_info_caches_instance(self, mock_unified_info):
+        unified_info = lib.get_unified_info()
+        self.assertIs(unified_info, mock_unified_info.return_value)
+        self.assertIs(lib.get_unified_info(), unified_info)
+        mock_unified_info.assert_called_once_with(partition=None)
+
+    @patch("clusterscope.lib.UnifiedInfo")
+    def test_get_unified_info_partition_change(self, mock_unified_info):
+        mock_unified_info.side_effect = lambda partition: MagicMock(partition=partition)
+        gpu_info = lib.get_unified_info("gpu")
+        self.assertIs(lib.get_unified_info("gpu"), gpu_info)
+        cpu_info = lib.get_unified_info("cpu")
+        self.assertIsNot(cpu_info, gpu_info)
+        self.assertEqual(cpu_info.partition, "cpu")
+        self.assertEqual(mock_unified_info.call_count, 2)
+
+    @patch.object(LocalNodeInfo, "get_gpu_generation_and_count")
+    def test_local_node_gpu_generation_and_count(self, mock_gpus):
+        gpus = [GPUInfo(gpu_gen="H100", gpu_count=8, vendor="nvidia")]
+        mock_gpus.return_value = gpus
+        self.assertEqual(lib.local_node_gpu_generation_and_count(), gpus)
+        self.assertEqual(lib.local_node_gpu_generation_and_count(), gpus)
+        mock_gpus.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import os
+import unittest
+from unittest.mock import patch
+
+from clusterscope.slurm import partition as partition_module
+from clusterscope.slurm.partition import (
+    _get_partition_info_cached,
+    _get_partition_map_cached,
+    get_partition_info,
+    get_partition_map,
+    get_partition_resources,
+    PartitionInfo,
+)
+
+SCONTROL_OUTPUT = (
+    "PartitionName=h100 AllowGroups=ALL Nodes=gpu[001-004] State=UP TRES=cpu=768,gres/gpu=32\n"
+    "PartitionName=cpu AllowGroups=ALL Nodes=cpu[001-002] State=UP\n"
+    "PartitionName=empty AllowGroups=ALL Nodes=(null) State=UP\n"
+)
+SINFO_OUTPUT = "h100|gpu:h100:8(S:0-1)|192\n" "h100|gpu:h100:4|96\n" "cpu|(null)|128\n"
+
+
+class TestPartition(unittest.TestCase):
+    """Test cases for Slurm partition queries."""
+
+    def setUp(self):
+        _get_partition_info_cached.cache_clear()
+        _get_partition_map_cached.cache_clear()
+        partition_module._partition_info_fetched_at = float("-inf")
+
+    def test_partition_info_immutable(self):
+        partition = PartitionInfo(
+            name="h100", max_gpus_per_node=8, max_cpus_per_node=192
+        )
+        with self.assertRaises(AttributeError):
+            partition.max_gpus_per_node = 4
+        self.assertEqual(hash(partition), hash(PartitionInfo("h100", 8, 192)))
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_info(self, mock_run_cached):
+        mock_run_cached.side_effect = [SCONTROL_OUTPUT, SINFO_OUTPUT]
+        self.assertEqual(
+            get_partition_info(),
+            [
+                PartitionInfo(name="h100", max_gpus_per_node=8, max_cpus_per_node=192),
+                PartitionInfo(name="cpu", max_gpus_per_node=0, max_cpus_per_node=128),
+                PartitionInfo(name="empty", max_gpus_per_node=0, max_cpus_per_node=0),
+            ],
+        )
+        self.assertEqual(mock_run_cached.call_count, 2)
+        mock_run_cached.assert_called_with(
+            ["sinfo", "-o", "%R|%G|%c", "--noheader"], ttl=0
+        )
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_info_cache_ttl(self, mock_run_cached):
+        mock_run_cached.side_effect = [SCONTROL_OUTPUT, SINFO_OUTPUT]
+        get_partition_info(cache_ttl=60)
+        mock_run_cached.assert_any_call(["scontrol", "show", "partition", "-o"], ttl=60)
+        mock_run_cached.assert_called_with(
+            ["sinfo", "-o", "%R|%G|%c", "--noheader"], ttl=60
+        )
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_info_cached(self, mock_run_cached):
+        mock_run_cached.side_effect = [SCONTROL_OUTPUT, SINFO_OUTPUT] * 2
+        with patch.dict(os.environ, {"CLUSTERSCOPE_PARTITION_TTL": "60"}):
+            partitions = get_partition_info()
+            self.assertEqual(get_partition_info(), partitions)
+        self.assertEqual(mock_run_cached.call_count, 2)
+
+        with patch.dict(os.environ, {"CLUSTERSCOPE_PARTITION_TTL": "0"}):
+            self.assertEqual(get_partition_info(), partitions)
+        self.assertEqual(mock_run_cached.call_count, 4)
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_info_invalid_ttl(self, mock_run_cached):
+        mock_run_cached.side_effect = [SCONTROL_OUTPUT, SINFO_OUTPUT]
+        with patch.dict(os.environ, {"CLUSTERSCOPE_PARTITION_TTL": "60s"}):
+            with self.assertLogs(level="WARNING") as logs:
+                partitions = get_partition_info()
+        self.assertEqual(len(partitions), 3)
+        self.assertIn("CLUSTERSCOPE_PARTITION_TTL='60s'", logs.output[0])
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_map(self, mock_run_cached):
+        mock_run_cached.side_effect = [SCONTROL_OUTPUT, SINFO_OUTPUT]
+        partitions = get_partition_map()
+        self.assertEqual(list(partitions), ["h100", "cpu", "empty"])
+        self.assertEqual(partitions["h100"].max_gpus_per_node, 8)
+        self.assertIsNone(partitions.get("missing"))
+        self.assertEqual(get_partition_info(), list(partitions.values()))
+        self.assertEqual(mock_run_cached.call_count, 2)
+
+    @patch("clusterscope.slurm.partition.time.monotonic")
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_map_expires(self, mock_run_cached, mock_monotonic):
+        mock_run_cached.side_effect = [
+            SCONTROL_OUTPUT,
+            SINFO_OUTPUT,
+            SCONTROL_OUTPUT,
+            "h100|gpu:h100:4|96\ncpu|(null)|128\n",
+        ]
+        mock_monotonic.side_effect = [1000.0, 1030.0, 1061.0]
+        with patch.dict(os.environ, {"CLUSTERSCOPE_PARTITION_TTL": "60"}):
+            partitions = get_partition_map()
+            self.assertIs(get_partition_map(), partitions)
+            self.assertEqual(mock_run_cached.call_count, 2)
+
+            refreshed = get_partition_map()
+        self.assertIsNot(refreshed, partitions)
+        self.assertEqual(refreshed["h100"].max_gpus_per_node, 4)
+        self.assertEqual(mock_run_cached.call_count, 4)
+
+    @patch("clusterscope.slurm.partition.run_cached")
+    def test_get_partition_resources(self, mock_run_cached):
+        mock_run_cached.return_value = (
+            "h100|gpu:h100:8(S:0-1)|192\nh100|gpu:h100:4|96\n"
+        )
+        self.assertEqual(
+            get_partition_resources("h100"), {"max_gpus": 8, "max_cpus": 192}
+        )
+        mock_run_cached.assert_called_once_with(
+            ["sinfo", "-o", "%R|%G|%c", "--noheader", "--partition=h100"], ttl=0
+        )
+        mock_run_cached.return_value = ""
+        self.assertEqual(
+            get_partition_resources("empty"), {"max_gpus": 0, "max_cpus": 0}
+        )
+
+    @patch(
+        "clusterscope.slurm.partition.run_cached",
+        side_effect=FileNotFoundError("scontrol"),
+    )
+    def test_get_partition_info_error(self, mock_run_cached):
+        with self.assertRaises(RuntimeError):
+            get_partition_info()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,9 @@
 # LICENSE file in the root directory of this source tree.
 import json
 import unittest
+from unittest.mock import patch
 
-from clusterscope.cluster_info import ResourceShape
+from clusterscope.cluster_info import format_json, ResourceShape
 from clusterscope.parser import parse_memory_to_gb
 
 TEST_CONFIGS = [
@@ -66,6 +67,17 @@ class TestResourceShape(unittest.TestCase):
                 )
                 self.assertEqual(parse_memory_to_gb(resource.memory), expected_gb)
 
+    def test_memory_parsing_gb_int(self):
+        """Test that memory already in GB is returned as is."""
+        self.assertEqual(parse_memory_to_gb(225), 225)
+
+    def test_memory_parsing_invalid(self):
+        """Test memory parsing with invalid formats."""
+        for memory_str in ["", "512M", "1024"]:
+            with self.subTest(memory=memory_str):
+                with self.assertRaises(RuntimeError):
+                    parse_memory_to_gb(memory_str)
+
     def test_to_json(self):
         """Test to_json format method with various configurations."""
 
@@ -97,6 +109,29 @@ class TestResourceShape(unittest.TestCase):
                 self.assertEqual(result["tasks_per_node"], tasks_per_node)
                 self.assertEqual(result["mem_gb"], expected_mem_gb)
 
+    def test_to_json_without_orjson(self):
+        """Test to_json output is the same with and without orjson installed."""
+        resource = ResourceShape(
+            slurm_partition="test_partition",
+            gpus_per_task=1,
+            cpus_per_task=24,
+            memory="225G",
+            tasks_per_node=1,
+            nodes=1,
+        )
+        with patch("clusterscope.cluster_info.HAS_ORJSON", False):
+            result = resource.to_json()
+        self.assertEqual(result, json.dumps(resource.to_dict(), indent=2))
+        self.assertEqual(result, resource.to_json())
+
+    def test_format_json_non_ascii(self):
+        """Test non-ASCII text is output as is with and without orjson installed."""
+        data = {"partition": "gpü", "gpu_count": 8}
+        expected = '{\n  "partition": "gpü",\n  "gpu_count": 8\n}'
+        with patch("clusterscope.cluster_info.HAS_ORJSON", False):
+            self.assertEqual(format_json(data), expected)
+        self.assertEqual(format_json(data), expected)
+
     def test_to_sbatch(self):
         """Test to_sbatch format method with various configurations."""
 
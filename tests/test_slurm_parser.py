@@ -0,0 +1,33 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+import unittest
+
+from clusterscope.slurm.parser import parse_gres
+
+
+class TestParseGres(unittest.TestCase):
+    """Test cases for parse_gres."""
+
+    def test_parse_gres(self):
+        test_cases = [
+            ("gpu:4", 4),
+            ("gpu:a100:2", 2),
+            ("gpu:volta:8(S:0-1)", 8),
+            ("gpu:pascal:2", 2),
+            ("gpu:h100:8(IDX:0-7)", 8),
+            ("gpu:nvidia_h100_80gb_hbm3:8", 8),
+            ("(null)", 0),
+            ("", 0),
+            ("gpu", 0),
+            ("cpu:4", 0),
+        ]
+        for gres, expected in test_cases:
+            with self.subTest(gres=gres):
+                self.assertEqual(parse_gres(gres), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
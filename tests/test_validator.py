@@ -13,10 +13,7 @@ from unittest.mock import patch
 from clusterscope.slurm.partition import PartitionInfo
 from clusterscope.validate import job_gen_task_slurm_validator
 
-
-def has_slurm():
-    """Check if Slurm is installed."""
-    return shutil.which("scontrol") is not None
+HAS_SLURM = shutil.which("scontrol") is not None
 
 
 class TestValidator(unittest.TestCase):
@@ -75,7 +72,7 @@ class TestValidator(unittest.TestCase):
                 tasks_per_node=-1,
             )
 
-    @unittest.skipIf(not has_slurm(), "Slurm not available")
+    @unittest.skipIf(not HAS_SLURM, "Slurm not available")
     def test_job_gen_task_slurm_validator_non_existent_partition(self):
         with self.assertRaises(ValueError):
             job_gen_task_slurm_validator(
@@ -83,15 +80,23 @@ class TestValidator(unittest.TestCase):
                 cpus_per_task=1,
             )
 
-    @patch("clusterscope.validate.get_partition_info")
+    @patch("clusterscope.validate.get_partition_map", return_value={})
+    def test_job_gen_task_slurm_validator_missing_partition(self, mock_run):
+        with self.assertRaisesRegex(ValueError, "Partition missing not found"):
+            job_gen_task_slurm_validator(
+                partition="missing",
+                cpus_per_task=1,
+            )
+
+    @patch("clusterscope.validate.get_partition_map")
     def test_job_gen_task_slurm_validator_valid_cpu(self, mock_run):
-        mock_run.return_value = [
-            PartitionInfo(
+        mock_run.return_value = {
+            "test-partition": PartitionInfo(
                 name="test-partition",
                 max_cpus_per_node=10,
                 max_gpus_per_node=10,
             )
-        ]
+        }
 
         job_gen_task_slurm_validator(
             partition="test-partition",
@@ -99,15 +104,15 @@ class TestValidator(unittest.TestCase):
             tasks_per_node=2,
         )
 
-    @patch("clusterscope.validate.get_partition_info")
+    @patch("clusterscope.validate.get_partition_map")
     def test_job_gen_task_slurm_validator_valid_gpu(self, mock_run):
-        mock_run.return_value = [
-            PartitionInfo(
+        mock_run.return_value = {
+            "test-partition": PartitionInfo(
                 name="test-partition",
                 max_cpus_per_node=10,
                 max_gpus_per_node=10,
             )
-        ]
+        }
 
         job_gen_task_slurm_validator(
             partition="test-partition",
@@ -115,15 +120,15 @@ class TestValidator(unittest.TestCase):
             tasks_per_node=2,
         )
 
-    @patch("clusterscope.validate.get_partition_info")
+    @patch("clusterscope.validate.get_partition_map")
     def test_job_gen_task_slurm_validator_invalid_cpu(self, mock_run):
-        mock_run.return_value = [
-            PartitionInfo(
+        mock_run.return_value = {
+            "test-partition": PartitionInfo(
                 name="test-partition",
                 max_cpus_per_node=10,
                 max_gpus_per_node=10,
             )
-        ]
+        }
 
         with self.assertRaises(ValueError):
             job_gen_task_slurm_validator(
@@ -132,15 +137,15 @@ class TestValidator(unittest.TestCase):
                 tasks_per_node=1,
             )
 
-    @patch("clusterscope.validate.get_partition_info")
+    @patch("clusterscope.validate.get_partition_map")
     def test_job_gen_task_slurm_validator_invalid_gpu(self, mock_run):
-        mock_run.return_value = [
-            PartitionInfo(
+        mock_run.return_value = {
+            "test-partition": PartitionInfo(
                 name="test-partition",
                 max_cpus_per_node=10,
                 max_gpus_per_node=10,
             )
-        ]
+        }
 
         with self.assertRaises(ValueError):
             job_gen_task_slurm_validator(